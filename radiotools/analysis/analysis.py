@@ -62,13 +62,12 @@ def dynamic_range(path: str, *, offset: int = 75):
     dr : float
         Dynamic range of the source.
     """
-    hdu = fits.open(path)
+    with fits.open(path, memmap=True) as hdul:
+        image = hdul[0].data[0, 0, ...]
+        center = hdul[0].header["CRPIX1"], hdul[0].header["CRPIX2"]
 
-    image = hdu[0].data[0, 0, ...]
-    center = hdu[0].header["CRPIX1"], hdu[0].header["CRPIX2"]
+        _rms = get_source_rms(image, center, offset=75)
 
-    _rms = get_source_rms(image, center, offset=75)
-
-    dr = image.max() / _rms
+        dr = image.max() / _rms
 
     return dr
@@ -1,7 +1,44 @@
+import shlex
 import subprocess as sp
+import sys
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
-import toml
+import tomli_w
+
+if sys.version_info < (3, 11):
+    import tomli as tomllib
+else:
+    import tomllib
+
+
+# Config keys of the wrapper that are passed to WSClean
+# under a different name.
+_KEY_RENAMES = {
+    "file_name": "name",
+    "data_column": "data-column",
+    "auto_threshold": "auto-threshold",
+    "auto_mask": "auto-mask",
+}
+
+# Boolean config keys of the wrapper and the WSClean flags (without
+# arguments) they translate to if True or False, respectively. None
+# means that no flag is passed.
+_BOOL_FLAGS = {
+    "mf_weighting": ("mf-weighting", "no-mf-weighting"),
+    "verbose": (None, "quiet"),
+    "multiscale": ("multiscale", None),
+}
+
+
+@lru_cache
+def _load_toml(path: str, mtime_ns: int) -> dict:
+    """Loads a toml file. Results are cached per path and
+    modification time, so edited files are parsed again.
+    """
+    with open(path, "rb") as toml_file:
+        return tomllib.load(toml_file)
 
 
 class WSClean:
@@ -69,62 +106,34 @@ class WSClean:
             if not Path(clean_config).is_file():
                 raise OSError(f"File {Path(clean_config).absolute()} does not exist.")
 
-            with open(clean_config) as toml_file:
-                clean_config = toml.load(toml_file)
+            config_path = Path(clean_config).resolve()
+
+            # copy, since the cached dict must not be altered
+            clean_config = deepcopy(
+                _load_toml(str(config_path), config_path.stat().st_mtime_ns)
+            )
 
         if save_config:
             self._save_config(clean_config, save_config)
 
-        _clean_config = clean_config.copy()
-
-        _clean_config["name"] = _clean_config.pop("file_name")
-        _clean_config["data-column"] = _clean_config.pop("data_column")
-        _clean_config["auto-threshold"] = _clean_config.pop("auto_threshold")
-        _clean_config["auto-mask"] = _clean_config.pop("auto_mask")
-
-        # We need to handle the case if size is an int and not a list.
-        # This assumes, however, that x- and y- size are the same
-        if isinstance(_clean_config["size"], int):
-            _clean_config["size"] = [_clean_config["size"]] * 2
-
-        # mf-weighting and no-mf-weighting are flags without arguments.
-        # Since the wrapper only takes the bool mf_weighting as input,
-        # we have to handle both cases and pass the respective WSClean
-        # flags with an empty string as "argument".
-        if _clean_config["mf_weighting"] is False:
-            del _clean_config["mf_weighting"]
-            _clean_config["no-mf-weighting"] = ""
-        else:
-            del _clean_config["mf_weighting"]
-            _clean_config["mf-weighting"] = ""
-
-        # Same as with mf-weighting, WSClean has two flags -- verbose
-        # and quiet -- to handle output during cleaning. The wrapper
-        # only takes the bool verbose as input, as such we have to
-        # handle both cases.
-        if _clean_config["verbose"] is False:
-            del _clean_config["verbose"]
-            _clean_config["quiet"] = ""
-        else:
-            del _clean_config["verbose"]
-
-        # multiscale is another case of a flag without any arguments.
-        # As such, we have to either delete the key and value pair,
-        # or replace the bool with an empty string.
-        if _clean_config["multiscale"] is False:
-            del _clean_config["multiscale"]
-        else:
-            _clean_config["multiscale"] = ""
-
-        self._clean_config = _clean_config
+        _clean_config = self._normalize_config(clean_config)
+
+        # The output name is suffixed with the polarization exactly once
+        # and the command line is only built once, however often
+        # clean_image is called.
+        self._clean_config = _clean_config.copy()
+        self._clean_config["name"] += "_" + self._clean_config["pol"]
+        self._clean_argv = self._get_argv(self._clean_config)
 
         if create_skymodel:
-            self.skymodel_kwargs = _clean_config.copy()
-            self.skymodel_kwargs["name"] += f"_{self.skymodel_kwargs['pol']}_skymodel"
-            self.skymodel_kwargs["data-column"] = "DATA"
-            self.skymodel_kwargs["auto-threshold"] = 1
-            self.skymodel_kwargs["auto-mask"] = 3
-            self.skymodel_kwargs["niter"] = 1000000
+            self.skymodel_kwargs = {
+                **_clean_config,
+                "name": _clean_config["name"] + f"_{_clean_config['pol']}_skymodel",
+                "data-column": "DATA",
+                "auto-threshold": 1,
+                "auto-mask": 3,
+                "niter": 1000000,
+            }
 
             self.create_skymodel()
 
@@ -132,33 +141,78 @@ class WSClean:
         """Creates the skymodel using WSClean if ``create_skymodel``
         is set to ``True`` when initializing the class.
         """
-        wsclean_opts = "wsclean "
-        for key, val in self.skymodel_kwargs.items():
-            if isinstance(val, list):
-                wsclean_opts += f"-{key} {val[0]} {val[1]} "
-            else:
-                wsclean_opts += f"-{key} {val} "
-
-        wsclean_opts += str(self.ms)
-        sp.run(wsclean_opts, shell=True)
+        sp.run(self._get_argv(self.skymodel_kwargs), check=True)
 
         print(f"Saved to {self.skymodel_kwargs['name']}<...>.fits")
 
     def clean_image(self) -> None:
         """Cleans the image using WSClean."""
-        self._clean_config["name"] += "_" + self._clean_config["pol"]
+        sp.run(self._clean_argv, check=True)
+
+        print(f"Saved to {self._clean_config['name']}<...>.fits")
+
+    def _normalize_config(self, clean_config: dict) -> dict:
+        """Translates the wrapper config into WSClean options.
+
+        Parameters
+        ----------
+        clean_config : dict
+            Config as passed to the wrapper, see class docstring.
+
+        Returns
+        -------
+        _clean_config : dict
+            Config with WSClean option names as keys. Flags without
+            arguments have an empty string as value.
+        """
+        missing = (_KEY_RENAMES.keys() | _BOOL_FLAGS.keys()) - clean_config.keys()
+        if missing:
+            raise KeyError(
+                f"The config is missing the following options: {sorted(missing)}"
+            )
+
+        _clean_config = {}
+        for key, val in clean_config.items():
+            if key in _BOOL_FLAGS:
+                flag = _BOOL_FLAGS[key][val is False]
+                if flag is not None:
+                    _clean_config[flag] = ""
+            elif key == "size" and isinstance(val, int):
+                # This assumes that x- and y- size are the same
+                _clean_config["size"] = [val] * 2
+            else:
+                _clean_config[_KEY_RENAMES.get(key, key)] = val
+
+        return _clean_config
+
+    def _get_argv(self, config: dict) -> list[str]:
+        """Builds the WSClean command line from a normalized config.
+
+        Parameters
+        ----------
+        config : dict
+            Normalized config, see ``self._clean_config``.
+
+        Returns
+        -------
+        argv : list[str]
+            Argument list that can be passed to :func:`subprocess.run`.
+        """
+        argv = ["wsclean"]
+        for key, val in config.items():
+            argv.append(f"-{key}")
 
-        wsclean_opts = "wsclean "
-        for key, val in self._clean_config.items():
             if isinstance(val, list):
-                wsclean_opts += f"-{key} {val[0]} {val[1]} "
+                argv += [str(val[0]), str(val[1])]
             else:
-                wsclean_opts += f"-{key} {val} "
+                # Flags without arguments are stored as empty strings,
+                # multi-word values (e.g. 'briggs 0') are multiple arguments.
+                # Values can be quoted to keep them as a single argument.
+                argv += shlex.split(str(val))
 
-        wsclean_opts += self.ms
-        sp.run(wsclean_opts, shell=True)
+        argv.append(str(self.ms))
 
-        print(f"Saved to {self._clean_config['name']}<...>.fits")
+        return argv
 
     def _save_config(self, _clean_config: dict, output_file: bool | str | Path) -> None:
         """Saves the config if ``save_config`` is set to ``True``
@@ -168,5 +222,5 @@ class WSClean:
             output_file = Path(_clean_config["file_name"]).name
             output_file += f"_{_clean_config['pol']}" + "_config.toml"
 
-        with open(output_file, "w") as toml_file:
-            toml.dump(_clean_config, toml_file)
+        with open(output_file, "wb") as toml_file:
+            tomli_w.dump(_clean_config, toml_file)
@@ -12,8 +12,6 @@ def main():
         default="",
         show_default=False,
     )
-    from matplotlib.pyplot import show
-
     from radiotools.visibility.visibility import SourceVisibility
 
     if target == "" or target.isspace():
@@ -47,6 +45,8 @@ def main():
 
     plot = click.confirm("Plot visibility?", default=False)
     if plot:
+        from matplotlib.pyplot import show
+
         fig, _ = vis.plot()
         show(block=True)
 
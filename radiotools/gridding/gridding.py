@@ -1,4 +1,5 @@
 import warnings
+from functools import cached_property
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -6,7 +7,7 @@ import numpy as np
 from astropy.constants import c
 from astropy.io import fits
 from casatools.table import table
-from matplotlib.colors import LogNorm, PowerNorm
+from matplotlib.colors import LogNorm, PowerNorm, is_color_like
 
 
 class Gridder:
@@ -15,7 +16,9 @@ class Gridder:
     """
 
     def __init__(self):
-        None
+        # images of previous plots, which are updated in place
+        # if a plot is repeated on the same axis
+        self._images = {}
 
     def plot(
         self,
@@ -99,7 +102,9 @@ class Gridder:
         Parameters
         ----------
         plot_args : dict, optional
-            The arguments for the pyplot scatter plot of the uv tuples
+            The arguments for the pyplot scatter plot of the uv tuples.
+            Points of a single color with a size of at most 1 are drawn
+            as pixel markers instead
 
         save_to : str, optional
             Path to save the figure to
@@ -121,9 +126,26 @@ class Gridder:
         if ax is None:
             fig, ax = plt.subplots()
 
-        ax.scatter(
-            x=np.append(self.u, -self.u), y=np.append(self.v, -self.v), **plot_args
-        )
+        u = np.ravel(self.u)
+        v = np.ravel(self.v)
+        x = np.concatenate([u, -u])
+        y = np.concatenate([v, -v])
+
+        color = plot_args.get("color", "royalblue")
+        size = plot_args.get("s", 0.01)
+
+        # Single colored points of at most one pixel are drawn as pixel
+        # markers, which is much faster than a scatter plot for large
+        # numbers of points.
+        if (
+            plot_args.keys() <= {"color", "s"}
+            and is_color_like(color)
+            and np.ndim(size) == 0
+            and size <= 1
+        ):
+            ax.plot(x, y, marker=",", linestyle="none", color=color)
+        else:
+            ax.scatter(x=x, y=y, **plot_args)
 
         if annotation is not None:
             _plot_text(annotation, ax, (0.05, 0.95))
@@ -199,27 +221,34 @@ class Gridder:
         if ax is None:
             fig, ax = plt.subplots(layout="constrained")
 
-        img = self.mask
+        # single precision is sufficient for display and halves
+        # the memory matplotlib has to process while drawing
+        img = self.mask.astype(np.float32)
 
         if invert_x:
             img = np.fliplr(img)
 
-        im0 = ax.imshow(
-            np.rot90(img, rot90),
-            origin="lower",
-            **plot_args,
-        )
-
-        if annotation is not None:
-            _plot_text(annotation, ax, (0.05, 0.95))
-
-        ax.set_xlim(crop[0][0], crop[0][1])
-        ax.set_ylim(crop[1][0], crop[1][1])
-        ax.set_xlabel("pixels")
-        ax.set_ylabel("pixels")
-        fig.colorbar(
-            im0, ax=ax, shrink=colorbar_shrink, label="$(u,v)$ per pixel in 1 / px"
+        img, plot_args = _decimate(np.rot90(img, rot90), fig, crop, plot_args)
+        settings = dict(
+            crop=crop,
+            plot_args=plot_args,
+            annotation=annotation,
+            colorbar_shrink=colorbar_shrink,
         )
+        if not self._reuse_image("mask", ax, img, settings):
+            im0 = ax.imshow(img, origin="lower", **plot_args)
+
+            if annotation is not None:
+                _plot_text(annotation, ax, (0.05, 0.95))
+
+            ax.set_xlim(crop[0][0], crop[0][1])
+            ax.set_ylim(crop[1][0], crop[1][1])
+            ax.set_xlabel("pixels")
+            ax.set_ylabel("pixels")
+            fig.colorbar(
+                im0, ax=ax, shrink=colorbar_shrink, label="$(u,v)$ per pixel in 1 / px"
+            )
+            self._images["mask"] = (im0, settings)
 
         if save_to is not None:
             fig.savefig(save_to, **save_args)
@@ -289,26 +318,31 @@ class Gridder:
         if ax is None:
             fig, ax = plt.subplots(layout="constrained")
 
-        img = np.absolute(self.mask_real + self.mask_imag * 1j)
+        img = self.mask_abs.astype(np.float32)
 
         if invert_x:
             img = np.fliplr(img)
 
-        im = ax.imshow(
-            np.rot90(img, rot90),
-            origin="lower",
-            **plot_args,
+        img, plot_args = _decimate(np.rot90(img, rot90), fig, crop, plot_args)
+        settings = dict(
+            crop=crop,
+            plot_args=plot_args,
+            annotation=annotation,
+            colorbar_shrink=colorbar_shrink,
         )
+        if not self._reuse_image("mask_absolute", ax, img, settings):
+            im = ax.imshow(img, origin="lower", **plot_args)
 
-        if annotation is not None:
-            _plot_text(annotation, ax, (0.05, 0.95))
+            if annotation is not None:
+                _plot_text(annotation, ax, (0.05, 0.95))
 
-        ax.set_xlim(crop[0][0], crop[0][1])
-        ax.set_ylim(crop[1][0], crop[1][1])
-        ax.set_xlabel("pixels")
-        ax.set_ylabel("pixels")
+            ax.set_xlim(crop[0][0], crop[0][1])
+            ax.set_ylim(crop[1][0], crop[1][1])
+            ax.set_xlabel("pixels")
+            ax.set_ylabel("pixels")
 
-        fig.colorbar(im, ax=ax, shrink=colorbar_shrink, label="Intensity in a.u.")
+            fig.colorbar(im, ax=ax, shrink=colorbar_shrink, label="Intensity in a.u.")
+            self._images["mask_absolute"] = (im, settings)
 
         if save_to is not None:
             fig.savefig(save_to, **save_args)
@@ -377,33 +411,42 @@ class Gridder:
         if ax is None:
             fig, ax = plt.subplots(layout="constrained")
 
-        img = np.angle(self.mask_real + self.mask_imag * 1j)
+        img = self.mask_phase.astype(np.float32)
 
         if invert_x:
             img = np.fliplr(img)
 
-        im = ax.imshow(
-            np.rot90(img),
-            origin="lower",
-            **plot_args,
+        # phases are negative as well, so the value of
+        # largest magnitude is shown for each block
+        img, plot_args = _decimate(
+            np.rot90(img), fig, crop, plot_args, reduce=_block_abs_max
         )
-
-        if annotation is not None:
-            _plot_text(annotation, ax, (0.05, 0.95))
-
-        ax.set_xlim(crop[0][0], crop[0][1])
-        ax.set_ylim(crop[1][0], crop[1][1])
-        ax.set_xlabel("pixels")
-        ax.set_ylabel("pixels")
-
-        cbar = fig.colorbar(
-            im,
-            ax=ax,
-            shrink=colorbar_shrink,
-            label="Phase difference in rad",
+        settings = dict(
+            crop=crop,
+            plot_args=plot_args,
+            annotation=annotation,
+            colorbar_shrink=colorbar_shrink,
         )
-        cbar.set_ticks(np.arange(-np.pi, 3 / 2 * np.pi, np.pi / 2))
-        cbar.set_ticklabels(["$-\\pi$", "$-\\pi/2$", "$0$", "$\\pi/2$", "$\\pi$"])
+        if not self._reuse_image("mask_phase", ax, img, settings):
+            im = ax.imshow(img, origin="lower", **plot_args)
+
+            if annotation is not None:
+                _plot_text(annotation, ax, (0.05, 0.95))
+
+            ax.set_xlim(crop[0][0], crop[0][1])
+            ax.set_ylim(crop[1][0], crop[1][1])
+            ax.set_xlabel("pixels")
+            ax.set_ylabel("pixels")
+
+            cbar = fig.colorbar(
+                im,
+                ax=ax,
+                shrink=colorbar_shrink,
+                label="Phase difference in rad",
+            )
+            cbar.set_ticks(np.arange(-np.pi, 3 / 2 * np.pi, np.pi / 2))
+            cbar.set_ticklabels(["$-\\pi$", "$-\\pi/2$", "$0$", "$\\pi/2$", "$\\pi$"])
+            self._images["mask_phase"] = (im, settings)
 
         if save_to is not None:
             fig.savefig(save_to, **save_args)
@@ -501,7 +544,8 @@ class Gridder:
 
         norm = None if exp == 1 else PowerNorm(gamma=exp)
 
-        img = np.rot90(dirty_image, rot90)
+        img = np.rot90(dirty_image, rot90).astype(np.float32)
+        img *= img_multiplier
 
         if invert_x:
             img = np.fliplr(img)
@@ -509,25 +553,102 @@ class Gridder:
         if invert_y:
             img = np.flipud(img)
 
-        im = ax.imshow(img * img_multiplier, norm=norm, origin="lower", **plot_args)
-
-        if annotation is not None:
-            _plot_text(annotation, ax, (0.05, 0.95))
-
-        ax.set_xlabel("pixels")
-        ax.set_ylabel("pixels")
-        fig.colorbar(
-            im,
-            ax=ax,
-            shrink=colorbar_shrink,
-            label="Flux density in Jy/px",
+        settings = dict(
+            crop=crop,
+            exp=exp,
+            plot_args=plot_args,
+            annotation=annotation,
+            colorbar_shrink=colorbar_shrink,
         )
+        if not self._reuse_image(f"dirty_image_{mode}", ax, img, settings):
+            im = ax.imshow(img, norm=norm, origin="lower", **plot_args)
+
+            if annotation is not None:
+                _plot_text(annotation, ax, (0.05, 0.95))
+
+            ax.set_xlabel("pixels")
+            ax.set_ylabel("pixels")
+            fig.colorbar(
+                im,
+                ax=ax,
+                shrink=colorbar_shrink,
+                label="Flux density in Jy/px",
+            )
+            self._images[f"dirty_image_{mode}"] = (im, settings)
 
         if save_to is not None:
             fig.savefig(save_to, **save_args)
 
         return fig, ax
 
+    def _reuse_image(self, name, ax, img, settings):
+        """
+        Updates the image of a previous plot on the same axis in place,
+        which is much faster than creating a new image and colorbar.
+        This is only done if the plot settings are the same as for the
+        previous plot, since the crop, norm, colormap, annotation and
+        colorbar of the previous plot are kept
+
+        Parameters
+        ----------
+        name : str
+            The name of the plot
+
+        ax : matplotlib.axes._axes.Axes
+            The axis to plot into
+
+        img : array_like
+            The image to display
+
+        settings : dict
+            The arguments of the plot function, including the
+            arguments for the pyplot imshow plot as ``plot_args``
+
+        Returns
+        -------
+        bool
+            Whether an image was updated
+
+        """
+        im, prev_settings = self._images.get(name, (None, None))
+
+        if im is None or im not in ax.images:
+            return False
+
+        if not _same_settings(settings, prev_settings):
+            return False
+
+        plot_args = settings["plot_args"]
+
+        im.set_data(img)
+
+        if "extent" in plot_args:
+            im.set_extent(plot_args["extent"])
+
+        if "vmin" not in plot_args and "vmax" not in plot_args:
+            im.autoscale()
+
+        ax.figure.canvas.draw_idle()
+
+        return True
+
+    @cached_property
+    def dirty_img_cmplx(self):
+        """The complex dirty image. Computed on first access, since
+        only the real part is needed for most plots.
+        """
+        return _dirty_image(self._mask_complex)
+
+    @cached_property
+    def mask_abs(self):
+        """The absolute values of the gridded visibilities."""
+        return np.abs(self._mask_complex)
+
+    @cached_property
+    def mask_phase(self):
+        """The phases of the gridded visibilities."""
+        return np.angle(self._mask_complex)
+
     def _create_attributes(self, uu, vv, stokes_i):
         """
         Internal method to calculate the mask (UV coverage) and the dirty image
@@ -558,47 +679,67 @@ class Gridder:
 
         self.stokes_i = stokes_i
 
-        real = stokes_i.real.T
-        imag = stokes_i.imag.T
-
-        samps = np.array(
-            [
-                np.append(-u.ravel(), u.ravel()),
-                np.append(-v.ravel(), v.ravel()),
-                np.append(real.ravel(), real.ravel()),
-                np.append(imag.ravel(), -imag.ravel()),
-            ]
-        )
+        # plain arrays, u and v may be (dimensionless) quantities
+        u_samps = np.asarray(u).ravel()
+        v_samps = np.asarray(v).ravel()
+        real = stokes_i.real.ravel()
+        imag = stokes_i.imag.ravel()
 
         N = self.img_size
 
         delta_l = self.fov / N
         delta = (N * delta_l) ** (-1)
 
-        bins = (
-            np.arange(start=-(N / 2) * delta, stop=(N / 2 + 1) * delta, step=delta)
-            - delta / 2
-        )
-
-        mask, *_ = np.histogram2d(samps[0], samps[1], bins=[bins, bins], density=False)
-        mask[mask == 0] = 1
-
-        mask_real, x_edges, y_edges = np.histogram2d(
-            samps[0], samps[1], bins=[bins, bins], weights=samps[2], density=False
+        # The visibilities are Hermitian, V(-u, -v) = V*(u, v). Instead of
+        # gridding each sample a second time at (-u, -v), the samples are
+        # gridded once on a grid extended by one bin and the point-mirrored
+        # grid is added. With bin centers at (i - N/2) * delta, the mirror
+        # of bin i is bin N - i.
+        iu = np.floor(u_samps / delta + (N / 2 + 0.5)).astype(np.intp)
+        iv = np.floor(v_samps / delta + (N / 2 + 0.5)).astype(np.intp)
+
+        # Samples outside of the grid are collected in an additional
+        # overflow bin, so the weights do not have to be filtered.
+        n_bins = (N + 1) ** 2
+        inside = (iu >= 0) & (iu <= N) & (iv >= 0) & (iv <= N)
+        idx = np.where(inside, iu * (N + 1) + iv, n_bins)
+
+        # bin indices are computed once and shared by all three grids
+        shape = (N + 1, N + 1)
+        counts = np.bincount(idx, minlength=n_bins + 1)[:n_bins].reshape(shape)
+        weights_real = np.bincount(idx, weights=real, minlength=n_bins + 1)
+        weights_real = weights_real[:n_bins].reshape(shape)
+        weights_imag = np.bincount(idx, weights=imag, minlength=n_bins + 1)
+        weights_imag = weights_imag[:n_bins].reshape(shape)
+
+        mask = (counts[:N, :N] + counts[N:0:-1, N:0:-1]).astype(np.float64)
+        np.maximum(mask, 1, out=mask)
+
+        # mask_real and mask_imag are views into one complex grid,
+        # so the complex grid is available without a copy.
+        mask_complex = np.empty((N, N), dtype=np.complex128)
+
+        # The imaginary part enters with flipped sign at (u, v)
+        # and unchanged at the mirrored position (-u, -v).
+        np.add(
+            weights_real[:N, :N], weights_real[N:0:-1, N:0:-1], out=mask_complex.real
         )
-        mask_imag, x_edges, y_edges = np.histogram2d(
-            samps[0], samps[1], bins=[bins, bins], weights=samps[3], density=False
+        np.subtract(
+            weights_imag[N:0:-1, N:0:-1], weights_imag[:N, :N], out=mask_complex.imag
         )
-        mask_real /= mask
-        mask_imag /= mask
+
+        mask_complex /= mask
 
         self.mask = mask
-        self.mask_real = mask_real
-        self.mask_imag = mask_imag
-        self.dirty_img_cmplx = np.fft.fftshift(
-            np.fft.ifft2(np.fft.fftshift(mask_real + 1j * mask_imag))
-        )
-        self.dirty_img = np.real(self.dirty_img_cmplx)[:, ::-1]
+        self._mask_complex = mask_complex
+        self.mask_real = mask_complex.real
+        self.mask_imag = mask_complex.imag
+
+        # derived quantities are only computed if accessed
+        for attr in ("dirty_img_cmplx", "mask_abs", "mask_phase"):
+            self.__dict__.pop(attr, None)
+
+        self.dirty_img = _real_dirty_image(mask_complex)[:, ::-1]
 
         return self
 
@@ -633,25 +774,24 @@ class Gridder:
         cls.img_size = img_size
         cls.fov = fov * np.pi / (3600 * 180)
 
-        file = fits.open(fits_path)
+        with fits.open(fits_path, memmap=True, mode="readonly") as file:
+            # only the needed columns are read from the memory map
+            data = file[0].data
 
-        data = file[0].data.T
+            uu = data["UU--"] * c
+            vv = data["VV--"] * c
 
-        uu = data["UU--"].T * c
-        vv = data["VV--"].T * c
+            cls.freq = file[0].header["CRVAL4"]
 
-        cls.freq = file[0].header["CRVAL4"]
-        stokes_i = np.array(
-            file[0].data["DATA"][..., 0, 0]
-            + file[0].data["DATA"][..., 0, 1] * 1j
-            + file[0].data["DATA"][..., 1, 0]
-            + file[0].data["DATA"][..., 1, 1] * 1j,
-        ).flatten()[:, None]
+            vis = data["DATA"]
+            stokes_i = (
+                vis[..., 0, 0] + vis[..., 1, 0] + 1j * (vis[..., 0, 1] + vis[..., 1, 1])
+            ).reshape(-1, 1)
 
         return cls._create_attributes(uu, vv, stokes_i)
 
     @classmethod
-    def from_ms(cls, ms_path, img_size, fov, desc_id=None):
+    def from_ms(cls, ms_path, img_size, fov, desc_id=None, chunk_size=100000):
         """
         Initializes the Gridder with a measurement which is saved in a NRAO CASA measurement set
 
@@ -669,6 +809,9 @@ class Gridder:
         desc_id: int
             The desc_id of the visibilites which should be gridded.
 
+        chunk_size: int, optional
+            The number of rows of the measurement set which are read at once.
+
         """
 
         if ms_path[-1] != "/":
@@ -689,27 +832,179 @@ class Gridder:
         tab = table(ms_path)
 
         if desc_id is not None:
-            mask = tab.getcol("DATA_DESC_ID") == desc_id
-            data = tab.getcol("DATA")[:, :, mask].T
-            uvw = tab.getcol("UVW")[:, mask].T
+            # selects the rows in casacore instead of masking them in numpy
+            tab = tab.query(f"DATA_DESC_ID=={desc_id}")
+
+        n_rows = tab.nrows()
+
+        if n_rows == 0:
+            # e.g. no rows with the given desc_id
+            stokes_i = np.empty((0, 1), dtype=np.complex64)
+            uvw = np.empty((0, 3))
         else:
-            data = tab.getcol("DATA").T
-            uvw = tab.getcol("UVW").T
+            # Only the first two correlations, which sum to Stokes I, are
+            # read, in chunks of rows to limit the memory usage.
+            n_chan = tab.getcell("DATA", 0).shape[1]
+            blc, trc = [0, 0], [1, n_chan - 1]
+
+            stokes_i = []
+            uvw = []
+            for start_row in range(0, n_rows, chunk_size):
+                n_chunk = min(chunk_size, n_rows - start_row)
+
+                data = tab.getcolslice("DATA", blc, trc, [], start_row, n_chunk)
+                stokes_i.append((data[0] + data[1]).T)
+                uvw.append(tab.getcol("UVW", start_row, n_chunk).T)
+
+            stokes_i = np.concatenate(stokes_i)
+            uvw = np.concatenate(uvw)
 
         try:
             cls.freq = table(ms_path + "SPECTRAL_WINDOW").getcol("CHAN_FREQ").T
         except Exception:
             cls.freq = 230e9
 
-        uvw = np.repeat(uvw[None], 1, axis=0)
-        uu = uvw[:, :, 0]
-        vv = uvw[:, :, 1]
-
-        stokes_i = data[:, :, 0] + data[:, :, 1]
+        uu = uvw[:, 0]
+        vv = uvw[:, 1]
 
         return cls._create_attributes(uu, vv, stokes_i)
 
 
+def _same_settings(settings, prev_settings):
+    """Checks whether the plot settings of two plots are the same.
+    The extent is ignored, since it is updated when reusing an image.
+    Objects like norms are only the same if they are identical.
+    """
+    settings, prev_settings = (
+        {
+            **s,
+            "plot_args": {k: v for k, v in s["plot_args"].items() if k != "extent"},
+        }
+        for s in (settings, prev_settings)
+    )
+
+    try:
+        return bool(settings == prev_settings)
+    except (TypeError, ValueError):
+        # e.g. arrays in the settings, which have no single truth value
+        return False
+
+
+def _dirty_image(vis_grid):
+    """Computes the complex dirty image from the centered
+    complex visibility grid.
+    """
+    if vis_grid.shape[0] % 2 or vis_grid.shape[1] % 2:
+        return np.fft.fftshift(np.fft.ifft2(np.fft.fftshift(vis_grid)))
+
+    # For even N, fftshift(ifft2(fftshift(x))) equals s * ifft2(s * x)
+    # with the checkerboard pattern s = (-1)^(i + j). Applying s in
+    # place saves the two copies made by fftshift.
+    vis_grid = vis_grid.copy()
+    _negate_checkerboard(vis_grid)
+    dirty_img = np.fft.ifft2(vis_grid)
+    _negate_checkerboard(dirty_img)
+
+    return dirty_img
+
+
+def _real_dirty_image(vis_grid):
+    """Computes the real part of the dirty image from the centered
+    complex visibility grid.
+    """
+    n_rows, n_cols = vis_grid.shape
+
+    if n_rows % 2 or n_cols % 2:
+        return np.real(_dirty_image(vis_grid))
+
+    # The real part of the inverse FFT only depends on the Hermitian
+    # part of the grid, so a real inverse FFT of half the grid suffices.
+    # The gridded visibilities are Hermitian by construction, except
+    # for the first row and column (the negative Nyquist frequencies),
+    # whose mirrored samples fall outside of the grid. Those two lines
+    # are symmetrized explicitly.
+    half = vis_grid[:, : n_cols // 2 + 1].copy()
+
+    row = vis_grid[0]
+    row = (row + np.conj(np.roll(row[::-1], 1))) / 2
+    half[0] = row[: n_cols // 2 + 1]
+
+    col = half[:, 0]
+    half[:, 0] = (col + np.conj(np.roll(col[::-1], 1))) / 2
+
+    # same shift as in _dirty_image
+    _negate_checkerboard(half)
+    dirty_img = np.fft.irfft2(half, s=(n_rows, n_cols))
+    _negate_checkerboard(dirty_img)
+
+    return dirty_img
+
+
+def _decimate(img, fig, crop, plot_args, reduce=None):
+    """Decimates an image for display to about the pixel resolution
+    of the figure. Blocks of pixels are reduced to single pixels with
+    ``reduce``, by default their maximum, so that sparse non-zero pixels
+    are not lost. The returned plot arguments contain the extent,
+    which keeps the axes in pixels of the original image.
+    """
+    if "extent" in plot_args:
+        return img, plot_args
+
+    if reduce is None:
+        reduce = _block_max
+
+    n_rows, n_cols = img.shape
+
+    # the displayed span in pixels, either the cutout or the whole image
+    span = max(
+        abs(hi - lo) if None not in (lo, hi) else n
+        for (lo, hi), n in zip(crop, (n_cols, n_rows))
+    )
+    stride = max(1, int(span // max(fig.get_size_inches() * fig.dpi)))
+
+    if stride == 1:
+        return img, plot_args
+
+    # pad with zeros to whole blocks of stride x stride pixels
+    img = np.pad(img, ((0, -n_rows % stride), (0, -n_cols % stride)))
+    blocks = img.reshape(img.shape[0] // stride, stride, img.shape[1] // stride, stride)
+    img = reduce(blocks)
+
+    extent = (
+        -0.5,
+        img.shape[1] * stride - 0.5,
+        -0.5,
+        img.shape[0] * stride - 0.5,
+    )
+
+    return img, {**plot_args, "extent": extent}
+
+
+def _block_max(blocks):
+    """Reduces blocks of shape (rows, stride, cols, stride)
+    to their maximum.
+    """
+    return blocks.max(axis=(1, 3))
+
+
+def _block_abs_max(blocks):
+    """Reduces blocks of shape (rows, stride, cols, stride)
+    to their values of largest magnitude, keeping the sign.
+    """
+    flat = blocks.transpose(0, 2, 1, 3).reshape(*blocks.shape[::2], -1)
+    idx = np.abs(flat).argmax(axis=-1)
+
+    return np.take_along_axis(flat, idx[..., np.newaxis], axis=-1)[..., 0]
+
+
+def _negate_checkerboard(a):
+    """Negates every element of the 2d array ``a`` with an odd index sum
+    in place, i.e. multiplies ``a`` with ``(-1)^(i + j)``.
+    """
+    a[::2, 1::2] *= -1
+    a[1::2, ::2] *= -1
+
+
 def _plot_text(
     text,
     ax,
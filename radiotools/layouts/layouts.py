@@ -1,14 +1,17 @@
-import urllib
-import uuid
+import copy
+from functools import lru_cache
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from astropy.coordinates import EarthLocation
 
 pd.options.display.float_format = "{:f}".format
 
+_WGS84_A = 6378137.0  # WGS84 equatorial semimajor axis
+_WGS84_B = 6356752.3142  # WGS84 polar semimajor axis
+_WGS84_E2 = 1.0 - (_WGS84_B / _WGS84_A) ** 2  # squared eccentricity
+
 
 class Layout:
     """
@@ -25,17 +28,27 @@ class Layout:
 
         """
 
-        loc = np.array([self.x, self.y]).T
-        baselines = np.array([])
+        # cached as long as the coordinates are not replaced
+        cached = getattr(self, "_baselines", None)
+        if cached is not None and cached[0] is self.x and cached[1] is self.y:
+            return cached[2]
 
-        i = 0
-        for vec1 in loc:
-            for vec2 in loc[i + 1 :]:
-                baselines = np.append(
-                    baselines,
-                    np.linalg.norm(np.reshape(vec1 - vec2, (2, 1)), ord=2, axis=0),
-                )
-            i += 1
+        x = np.asarray(self.x, dtype=np.float64)
+        y = np.asarray(self.y, dtype=np.float64)
+
+        # All pairs i < j, in the same order as a loop over the stations.
+        # Filling the output row by row avoids index arrays, which would
+        # need twice the memory of the result for large layouts.
+        n = len(x)
+        baselines = np.empty(n * (n - 1) // 2)
+
+        start = 0
+        for i in range(n - 1):
+            end = start + n - 1 - i
+            np.hypot(x[i] - x[i + 1 :], y[i] - y[i + 1 :], out=baselines[start:end])
+            start = end
+
+        self._baselines = (self.x, self.y, baselines)
 
         return baselines
 
@@ -45,13 +58,12 @@ class Layout:
 
         """
 
-        loc = np.array([self.x, self.y]).T
-        baselines = np.array([])
+        loc = np.stack((self.x, self.y), axis=1).astype(np.float64, copy=False)
 
-        for vec1 in loc:
-            for vec2 in loc:
-                baselines = np.append(baselines, np.reshape(vec1 - vec2, (2, 1)))
-        return np.reshape(baselines, (int(len(baselines) / 2), 2)).T
+        # row i * N + j holds the vector from station j to station i
+        baselines = loc[:, None, :] - loc[None, :, :]
+
+        return baselines.reshape(-1, 2).T
 
     def get_max_resolution(self, frequency):
         """
@@ -76,41 +88,60 @@ class Layout:
             The name of the station (antenna). This is case sensitive!
 
         """
-        if name not in self.names:
+        # rows per station name, cached as long as the names are not replaced
+        cached = getattr(self, "_name_index", None)
+        if cached is None or cached[0] is not self.names:
+            name_index = {}
+            for i, station_name in enumerate(self.names):
+                name_index.setdefault(station_name, []).append(i)
+
+            self._name_index = cached = (self.names, name_index)
+
+        rows = cached[1].get(name)
+
+        if rows is None:
             raise KeyError(
                 "This station could not be found. Make sure you typed the name correctly (case sensitive)!"
             )
 
-        df = self.get_dataframe()
-
-        return df.loc[df["station_name"] == name]
+        return pd.DataFrame(
+            data={key: np.asarray(val)[rows] for key, val in self._columns().items()},
+            index=rows,
+        )
 
     def get_dataframe(self):
         """
         Returns the layout data as a `pandas.DataFrame`.
         """
 
-        return pd.DataFrame(
-            data={
-                "x": self.x,
-                "y": self.y,
-                "z": self.z,
-                "dish_dia": self.dish_dia,
-                "station_name": self.names,
-                "el_low": self.el_low,
-                "el_high": self.el_high,
-                "sefd": self.sefd,
-                "altitude": self.altitude,
-            }
-        )
+        return pd.DataFrame(data=self._columns())
+
+    def _columns(self):
+        """
+        Returns the layout data as a dict of columns.
+        """
+
+        return {
+            "x": self.x,
+            "y": self.y,
+            "z": self.z,
+            "dish_dia": self.dish_dia,
+            "station_name": self.names,
+            "el_low": self.el_low,
+            "el_high": self.el_high,
+            "sefd": self.sefd,
+            "altitude": self.altitude,
+        }
 
     def __str__(self):
+        baselines = self.get_baselines()
+
         output = f"Configuration file loaded from: {self.cfg_path}"
         output += f"\nRelative to site: {self.rel_to_site}"
         output += f"\nNumber of antennas: {len(self.x)}"
-        output += f"\nNumber of baselines: {np.sum([i for i in range(len(self.x))])}"
-        output += f"\nLongest baseline: {np.max(self.get_baselines())} m"
-        output += f"\nShortest baseline: {np.min(self.get_baselines())} m"
+        output += f"\nNumber of baselines: {len(baselines)}"
+        output += f"\nLongest baseline: {np.max(baselines)} m"
+        output += f"\nShortest baseline: {np.min(baselines)} m"
         output += f"\n\n{self.get_dataframe()}"
         return output
 
@@ -136,19 +167,9 @@ class Layout:
 
         """
 
-        def gen_rng_file():
-            return Path(f"./temp_cfg_{uuid.uuid4()}.cfg")
-
-        temp_path = gen_rng_file()
-
-        while temp_path.is_file():
-            temp_path = gen_rng_file()
-
-        self.save(temp_path, rel_to_site=rel_to_site)
-        new_layout = Layout.from_pyvisgen(temp_path, rel_to_site=rel_to_site)
-
-        temp_path.unlink()
-        new_layout.cfg_path = self.cfg_path
+        new_layout = copy.copy(self)
+        new_layout.x, new_layout.y, new_layout.z = self._transform_coords(rel_to_site)
+        new_layout.rel_to_site = rel_to_site
 
         return new_layout
 
@@ -164,21 +185,9 @@ class Layout:
                 "not be converted in absolute coordinates."
             )
 
-        def gen_rng_file(increment=0):
-            return Path(f"./temp_cfg_{uuid.uuid4()}.cfg")
-
-        temp_path = gen_rng_file()
-
-        i = 1
-        while temp_path.is_file():
-            temp_path = gen_rng_file(i)
-            i += 1
-
-        self.save(temp_path)
-        new_layout = Layout.from_pyvisgen(temp_path)
-
-        temp_path.unlink()
-        new_layout.cfg_path = self.cfg_path
+        new_layout = copy.copy(self)
+        new_layout.x, new_layout.y, new_layout.z = self._transform_coords(None)
+        new_layout.rel_to_site = None
 
         return new_layout
 
@@ -189,6 +198,7 @@ class Layout:
         plot_args={"color": "royalblue", "alpha": 0.5},
         save_args={},
         show_zeros=False,
+        max_points=50000,
     ):
         """
         Plots the uv-sampling (uv-plane) of the array.
@@ -204,6 +214,11 @@ class Layout:
         save_args : dict, optional
             Arguments to pass to the figure.savefig function
 
+        max_points : int or None, optional
+            The maximal number of baselines to plot. Larger layouts are
+            plotted with a random subset of this size (default is 50000).
+            Set to None to always plot all baselines.
+
         """
 
         baselines = self.get_baseline_vecs()
@@ -212,12 +227,20 @@ class Layout:
             nonzero_bl = np.linalg.norm(baselines, axis=0) != 0
             baselines = baselines[:, nonzero_bl]
 
+        # imported here, pyplot is slow to import and only needed for plotting
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(1, 1, layout="constrained")
 
         if ref_frequency is not None:
             baselines /= 3e8 / ref_frequency
 
-        print(baselines[0].shape)
+        if max_points is not None and baselines.shape[1] > max_points:
+            # fixed seed, so that repeated plots look the same
+            rng = np.random.default_rng(42)
+            subset = rng.choice(baselines.shape[1], size=max_points, replace=False)
+            baselines = baselines[:, np.sort(subset)]
+
         ax.scatter(baselines[0], baselines[1], **plot_args)
         ax.set_xlabel("$u$ in m" if ref_frequency is None else "$u/\\lambda$")
         ax.set_ylabel("$v$ in m" if ref_frequency is None else "$v/\\lambda$")
@@ -261,6 +284,8 @@ class Layout:
             "c": self.altitude if not singular_alt else None,
         }
 
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(1, 1)
 
         im = ax.scatter(self.x, self.y, **options, **plot_args)
@@ -289,50 +314,24 @@ class Layout:
 
         return fig, ax
 
-    def save(self, path, fmt="pyvisgen", overwrite=False, rel_to_site=None):
+    def _transform_coords(self, rel_to_site):
         """
-        Saves the layout to a layout file.
+        Returns the station coordinates relative to the given site,
+        or as absolute (geocentric) coordinates if no site is given.
 
         Parameters
         ----------
-        path : str
-            The path of the file to save the array layout to.
-
-        fmt : str, optional
-            The layout format the output file is supposed to have
-            (available: casa, pyvisgen) (default is pyvisgen).
-
-        overwrite : bool, optional
-            Whether to overwrite the file if it already exists
-            (default is False).
-
-        rel_to_site : str, optional
-            The name of the site the coordinates are supposed to be saved relative to.
-            Is ignored is `None` or empty or `fmt` is not set to 'pyvisgen'.
+        rel_to_site : str
+            The name of the site the coordinates are supposed to be relative to.
+            Absolute coordinates are returned if `None` or empty.
             Has to be an existing site for `astropy.coordinates.EarthLocation.of_site()`.
 
         """
 
-        FORMATS = ["casa", "pyvisgen"]
-
-        file = Path(path)
-
-        if file.exists():
-            if overwrite:
-                file.unlink()
-            else:
-                raise FileExistsError(
-                    f"The file {file} already exists! If you want to overwrite it set overwrite=True!"
-                )
-
-        data = []
-
-        save_relative = not (rel_to_site is None or rel_to_site == "")
-
         nx, ny, nz = self.x, self.y, self.z
 
-        if save_relative:
-            # Is supposed to saved be in relative (local tangent plane) coordinates
+        if not (rel_to_site is None or rel_to_site == ""):
+            # Is supposed to be in relative (local tangent plane) coordinates
 
             location = EarthLocation.of_site(rel_to_site)
 
@@ -364,7 +363,7 @@ class Layout:
                 )
 
         else:
-            # Is supposed to be saved in absolute (geocentric) coordinates
+            # Is supposed to be in absolute (geocentric) coordinates
 
             if self.is_relative():
                 # ... but is relative --> convert to absolute
@@ -378,56 +377,94 @@ class Layout:
                     self.z,
                 )
 
-        match fmt:
-            case "pyvisgen":
-                data.append(
-                    "station_name X Y Z dish_dia el_low el_high SEFD altitude\n"
+        return nx, ny, nz
+
+    def save(self, path, fmt="pyvisgen", overwrite=False, rel_to_site=None):
+        """
+        Saves the layout to a layout file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to save the array layout to.
+
+        fmt : str, optional
+            The layout format the output file is supposed to have
+            (available: casa, pyvisgen) (default is pyvisgen).
+
+        overwrite : bool, optional
+            Whether to overwrite the file if it already exists
+            (default is False).
+
+        rel_to_site : str, optional
+            The name of the site the coordinates are supposed to be saved relative to.
+            Is ignored is `None` or empty or `fmt` is not set to 'pyvisgen'.
+            Has to be an existing site for `astropy.coordinates.EarthLocation.of_site()`.
+
+        """
+
+        FORMATS = ["casa", "pyvisgen"]
+
+        file = Path(path)
+
+        if file.exists():
+            if overwrite:
+                file.unlink()
+            else:
+                raise FileExistsError(
+                    f"The file {file} already exists! If you want to overwrite it set overwrite=True!"
                 )
 
-                for i in range(0, len(self.x)):
-                    row = map(
-                        str,
-                        [
-                            self.names[i],
-                            nx[i],
-                            ny[i],
-                            nz[i],
-                            self.dish_dia[i],
-                            self.el_low[i],
-                            self.el_high[i],
-                            self.sefd[i],
-                            self.altitude[i],
-                        ],
-                    )
-                    data.append(" ".join(row) + "\n")
+        header = []
+
+        save_relative = not (rel_to_site is None or rel_to_site == "")
+
+        nx, ny, nz = self._transform_coords(rel_to_site)
+
+        match fmt:
+            case "pyvisgen":
+                columns = {
+                    "station_name": self.names,
+                    "X": nx,
+                    "Y": ny,
+                    "Z": nz,
+                    "dish_dia": self.dish_dia,
+                    "el_low": self.el_low,
+                    "el_high": self.el_high,
+                    "SEFD": self.sefd,
+                    "altitude": self.altitude,
+                }
+                write_header = True
 
             case "casa":
                 if save_relative:
-                    data.append(f"observatory={rel_to_site}")
-                    data.append("coordsys=LOC (local tangent plane)")
-
-                data.append("# X Y Z dish_dia station_name\n")
-
-                for i in range(0, len(self.x)):
-                    row = map(
-                        str,
-                        [
-                            nx[i],
-                            ny[i],
-                            nz[i],
-                            self.dish_dia[i],
-                            self.names[i],
-                        ],
-                    )
-                    data.append(" ".join(row) + "\n")
+                    header.append(f"# observatory={rel_to_site}\n")
+                    header.append("# coordsys=LOC (local tangent plane)\n")
+
+                header.append("# X Y Z dish_dia station_name\n")
+
+                columns = {
+                    "X": nx,
+                    "Y": ny,
+                    "Z": nz,
+                    "dish_dia": self.dish_dia,
+                    "station_name": self.names,
+                }
+                write_header = False
 
             case _:
                 raise ValueError(
                     f"{fmt} is not a valid format! Possible formats are: {', '.join(FORMATS)}!"
                 )
 
+        # plain arrays, so that pandas does not align differing indices
+        data = pd.DataFrame({key: np.asarray(val) for key, val in columns.items()})
+
         with open(file, "w", encoding="utf-8") as f:
-            f.writelines(data)
+            f.writelines(header)
+            data.to_csv(
+                f, sep=" ", header=write_header, index=False, lineterminator="\n"
+            )
 
     @classmethod
     def from_casa(
@@ -470,7 +507,7 @@ class Layout:
 
         df = pd.read_csv(
             cfg_path,
-            delimiter="\s+",
+            delimiter=r"\s+",
             encoding="utf-8",
             skip_blank_lines=True,
             names=["x", "y", "z", "dish_dia", "station_name"],
@@ -486,11 +523,11 @@ class Layout:
         cls = cls()
         cls.cfg_path = cfg_path
         cls.rel_to_site = rel_to_site
-        cls.x = df["x"]
-        cls.y = df["y"]
-        cls.z = df["z"]
-        cls.dish_dia = df["dish_dia"]
-        cls.names = df["station_name"]
+        cls.x = df["x"].to_numpy(dtype=np.float64, copy=True)
+        cls.y = df["y"].to_numpy(dtype=np.float64, copy=True)
+        cls.z = df["z"].to_numpy(dtype=np.float64, copy=True)
+        cls.dish_dia = df["dish_dia"].to_numpy(dtype=np.float64, copy=True)
+        cls.names = df["station_name"].to_numpy(dtype=object, copy=True)
         cls.el_low = np.repeat(el_low, len(cls.x)) if np.isscalar(el_low) else el_low
         cls.el_high = (
             np.repeat(el_high, len(cls.x)) if np.isscalar(el_high) else el_high
@@ -520,7 +557,7 @@ class Layout:
 
         df = pd.read_csv(
             cfg_path,
-            delimiter="\s+",
+            delimiter=r"\s+",
             encoding="utf-8",
             skip_blank_lines=True,
             dtype={
@@ -538,17 +575,17 @@ class Layout:
         df.columns = map(str.lower, df.columns)
 
         cls = cls()
-        cls.names = df["station_name"]
+        cls.names = df["station_name"].to_numpy(dtype=object, copy=True)
         cls.cfg_path = cfg_path
         cls.rel_to_site = rel_to_site
-        cls.x = df["x"]
-        cls.y = df["y"]
-        cls.z = df["z"]
-        cls.dish_dia = df["dish_dia"]
-        cls.el_low = df["el_low"]
-        cls.el_high = df["el_high"]
-        cls.sefd = df["sefd"]
-        cls.altitude = df["altitude"]
+        cls.x = df["x"].to_numpy(dtype=np.float64, copy=True)
+        cls.y = df["y"].to_numpy(dtype=np.float64, copy=True)
+        cls.z = df["z"].to_numpy(dtype=np.float64, copy=True)
+        cls.dish_dia = df["dish_dia"].to_numpy(dtype=np.float64, copy=True)
+        cls.el_low = df["el_low"].to_numpy(dtype=np.float64, copy=True)
+        cls.el_high = df["el_high"].to_numpy(dtype=np.float64, copy=True)
+        cls.sefd = df["sefd"].to_numpy(dtype=np.float64, copy=True)
+        cls.altitude = df["altitude"].to_numpy(dtype=np.float64, copy=True)
 
         return cls
 
@@ -566,43 +603,50 @@ class Layout:
             existing site for `astropy.coordinates.EarthLocation.of_site()`.
             Default: None
         """
-        data = []
-        for line in urllib.request.urlopen(url):
-            data.append(line.decode("utf-8").split())
-
-        df = pd.DataFrame(data)
-        df = df.rename(columns=df.iloc[0]).drop(df.index[0])
-        df.columns = map(str.lower, df.columns)
-        df = df.astype(
-            {
-                "station_name": str,
-                "x": float,
-                "y": float,
-                "z": float,
-                "dish_dia": float,
-                "el_low": float,
-                "el_high": float,
-                "sefd": float,
-                "altitude": float,
-            }
+        df = pd.read_csv(
+            url,
+            delimiter=r"\s+",
+            encoding="utf-8",
+            skip_blank_lines=True,
+            dtype={"station_name": str},
         )
+        df.columns = df.columns.str.lower()
 
         cls = cls()
-        cls.names = df["station_name"]
+        cls.names = df["station_name"].to_numpy(dtype=object, copy=True)
         cls.cfg_path = url
         cls.rel_to_site = rel_to_site
-        cls.x = df["x"]
-        cls.y = df["y"]
-        cls.z = df["z"]
-        cls.dish_dia = df["dish_dia"]
-        cls.el_low = df["el_low"]
-        cls.el_high = df["el_high"]
-        cls.sefd = df["sefd"]
-        cls.altitude = df["altitude"]
+        cls.x = df["x"].to_numpy(dtype=np.float64, copy=True)
+        cls.y = df["y"].to_numpy(dtype=np.float64, copy=True)
+        cls.z = df["z"].to_numpy(dtype=np.float64, copy=True)
+        cls.dish_dia = df["dish_dia"].to_numpy(dtype=np.float64, copy=True)
+        cls.el_low = df["el_low"].to_numpy(dtype=np.float64, copy=True)
+        cls.el_high = df["el_high"].to_numpy(dtype=np.float64, copy=True)
+        cls.sefd = df["sefd"].to_numpy(dtype=np.float64, copy=True)
+        cls.altitude = df["altitude"].to_numpy(dtype=np.float64, copy=True)
 
         return cls
 
 
+@lru_cache(maxsize=32)
+def _site_params(cx, cy, cz):
+    """
+    Returns the geodetic longitude [deg], latitude [deg] and altitude [meter]
+    of a central point cx, cy, cz together with the prime vertical radius
+    and the sines and cosines of latitude and longitude needed by loc2itrf.
+    Cached, since usually only a few sites are converted repeatedly.
+
+    """
+    lon, lat, alt = geocentric2geodetic(cx, cy, cz)
+
+    # from Rob Reid;  need to generalize to use any datum...
+    phi, lmbda = np.deg2rad(lat), np.deg2rad(lon)
+    sphi = np.sin(phi)
+    N = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sphi**2)
+
+    return lon, lat, alt, N, sphi, np.cos(phi), np.cos(lmbda), np.sin(lmbda)
+
+
 def loc2itrf(cx, cy, cz, locx=0.0, locy=0.0, locz=0.0):
     """
     Returns the given points locx, locy, locz, which are relative to a common central point
@@ -633,27 +677,26 @@ def loc2itrf(cx, cy, cz, locx=0.0, locy=0.0, locz=0.0):
 
     """
 
-    lon, lat, alt = geocentric2geodetic(cx, cy, cz)
+    _, _, alt, N, sphi, cphi, clmb, slmb = _site_params(cx, cy, cz)
 
-    locx, locy, locz = map(np.array, (locx, locy, locz))
-    # from Rob Reid;  need to generalize to use any datum...
-    phi, lmbda = map(np.deg2rad, (lat, lon))
-    sphi = np.sin(phi)
-    a = 6378137.0  # WGS84 equatorial semimajor axis
-    b = 6356752.3142  # WGS84 polar semimajor axis
-    ae = np.arccos(b / a)
-    N = a / np.sqrt(1.0 - (np.sin(ae) * sphi) ** 2)
+    locx, locy, locz = (np.asarray(loc, dtype=np.float64) for loc in (locx, locy, locz))
 
-    factor = (N + locz + alt) * np.cos(phi) - locy * sphi
+    # in-place updates, so that every output only allocates
+    # one temporary array
+    factor = locz + (N + alt)
+    factor *= cphi
+    factor -= locy * sphi
 
-    clmb = np.cos(lmbda)
-    slmb = np.sin(lmbda)
+    cx = factor * clmb
+    cx -= locx * slmb
+    cy = factor * slmb
+    cy += locx * clmb
+    cz = locz + (N * (_WGS84_B / _WGS84_A) ** 2 + alt)
+    cz *= sphi
+    cz += locy * cphi
 
-    cx = factor * clmb - locx * slmb
-    cy = factor * slmb + locx * clmb
-    cz = (N * (b / a) ** 2 + locz + alt) * sphi + locy * np.cos(phi)
-
-    return cx, cy, cz
+    # [()] returns floats for scalar input and arrays otherwise
+    return cx[()], cy[()], cz[()]
 
 
 def itrf2loc(x, y, z, cx, cy, cz):
@@ -686,40 +729,29 @@ def itrf2loc(x, y, z, cx, cy, cz):
 
     """
 
-    clon, clat, h = geocentric2geodetic(cx, cy, cz)
+    clon, clat, *_ = _site_params(cx, cy, cz)
 
     ccoslon = np.cos(clon)
     csinlon = np.sin(clon)
     csinlat = np.sin(clat)
     ccoslat = np.cos(clat)
 
-    if isinstance(x, float):  # weak
-        x = [x]
-        y = [y]
-        z = [z]
-    n = x.__len__()
-    lat = np.zeros(n)
-    lon = np.zeros(n)
-    el = np.zeros(n)
-
-    # do like MsPlotConvert
-    for i in range(n):
-        # translate w/o rotating:
-        xtrans = x[i] - cx
-        ytrans = y[i] - cy
-        ztrans = z[i] - cz
-        # rotate
-        lat[i] = (-csinlon * xtrans) + (ccoslon * ytrans)
-        lon[i] = (
-            (-csinlat * ccoslon * xtrans)
-            - (csinlat * csinlon * ytrans)
-            + ccoslat * ztrans
-        )
-        el[i] = (
-            (ccoslat * ccoslon * xtrans)
-            + (ccoslat * csinlon * ytrans)
-            + csinlat * ztrans
-        )
+    # rotation into the local tangent plane (like MsPlotConvert)
+    rot = np.array(
+        [
+            [-csinlon, ccoslon, 0],
+            [-csinlat * ccoslon, -csinlat * csinlon, ccoslat],
+            [ccoslat * ccoslon, ccoslat * csinlon, csinlat],
+        ]
+    )
+
+    # translate w/o rotating, floats are treated as arrays of length one
+    points = np.column_stack(
+        [np.atleast_1d(np.asarray(coord, dtype=np.float64)) for coord in (x, y, z)]
+    )
+    points -= (cx, cy, cz)
+
+    lat, lon, el = (points @ rot.T).T
 
     return lat, lon, el
 
@@ -740,20 +772,11 @@ def geocentric2geodetic(x, y, z):
     The z-coordinate in WGS84 coordinates
     """
 
-    if np.isscalar(x):
-        lon, lat, alt = EarthLocation.from_geocentric(x, y, z, "m").to_geodetic()
-        lon = lon.deg
-        lat = lat.deg
-        alt = alt.value
-    else:
-        lon, lat, alt = np.array([]), np.array([]), np.array([])
-        for i in range(0, len(x)):
-            loc = EarthLocation.from_geocentric(x[i], y[i], z[i], "m")
-            lon = np.append(lon, loc.lon.deg)
-            lat = np.append(lat, loc.lon.deg)
-            alt = np.append(alt, loc.height.value)
+    lon, lat, alt = EarthLocation.from_geocentric(
+        *map(np.asarray, (x, y, z)), "m"
+    ).to_geodetic()
 
-    return lon, lat, alt
+    return lon.deg, lat.deg, alt.value
 
 
 def geodetic2geocentric(lon, lat, alt):
@@ -772,18 +795,8 @@ def geodetic2geocentric(lon, lat, alt):
     The altitude in geodetic coordinates
     """
 
-    if np.isscalar(lon):
-        x, y, z = EarthLocation.from_geodetic(
-            lon=lon, lat=lat, height=alt
-        ).to_geocentric()
-        x = x.value
-        y = y.value
-        z = z.value
-    else:
-        x, y, z = np.array([]), np.array([]), np.array([])
-        for i in range(0, len(lon)):
-            loc = EarthLocation.from_geodetic(lon=lon[i], lat=lat[i], height=alt[i])
-            x = np.append(x, loc.x.value)
-            y = np.append(y, loc.y.value)
-            z = np.append(z, loc.z.value)
-    return x, y, z
+    x, y, z = EarthLocation.from_geodetic(
+        lon=np.asarray(lon), lat=np.asarray(lat), height=np.asarray(alt)
+    ).to_geocentric()
+
+    return x.value, y.value, z.value
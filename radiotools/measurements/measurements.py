@@ -1,5 +1,6 @@
+import os
 import shutil
-import uuid
+import tempfile
 import warnings
 from datetime import datetime
 from pathlib import Path
@@ -40,17 +41,48 @@ class Measurement:
 
         root = Path(path)
 
-        if root.exists():
-            if overwrite:
+        if not root.exists():
+            self._ms_from_fits(path, nomodify=not overwrite)
+
+        elif overwrite:
+            # The measurement set is written next to the existing one, which
+            # is only replaced after the conversion succeeded. Since both are
+            # on the same filesystem, the replacement is a rename.
+            with tempfile.TemporaryDirectory(
+                dir=root.parent, prefix=".radiotools_"
+            ) as temp_dir:
+                temp_path = Path(temp_dir) / root.name
+
+                self._ms_from_fits(str(temp_path), nomodify=False)
+
                 shutil.rmtree(root)
-            else:
-                warnings.warn(
-                    f"The directory {root} already exists! If you want to overwrite it set overwrite=True!"
-                )
+                temp_path.rename(root)
 
-        if not root.exists() or overwrite:
-            ms = MeasurementTool()
-            ms.fromfits(msfile=path, fitsfile=self._fits_path, nomodify=not overwrite)
+        else:
+            warnings.warn(
+                f"The directory {root} already exists! If you want to overwrite it set overwrite=True!"
+            )
+
+    def _ms_from_fits(self, path, nomodify):
+        """
+        Converts the FITS file of this measurement to a measurement set.
+        The measurement tool is closed afterwards, also if the conversion fails.
+
+        Parameters
+        ----------
+        path: str
+        The path of the root of the measurement set
+
+        nomodify: bool
+        Whether the measurement set is opened read-only by the conversion.
+        """
+
+        ms = MeasurementTool()
+
+        try:
+            ms.fromfits(msfile=path, fitsfile=self._fits_path, nomodify=nomodify)
+        finally:
+            ms.close()
 
     def save_as_fits(self, path, overwrite=False):
         """
@@ -69,17 +101,25 @@ class Measurement:
 
         file = Path(path)
 
-        if file.is_file():
-            if overwrite:
-                file.unlink()
-            else:
-                warnings.warn(
-                    f"The file {file} already exists! If you want to overwrite it set overwrite=True!"
-                )
-
-        if not file.is_file() or overwrite:
+        if not file.is_file():
             self._ms.tofits(path, overwrite=overwrite)
 
+        elif overwrite:
+            # see save_as_ms, os.replace swaps the files atomically
+            with tempfile.TemporaryDirectory(
+                dir=file.parent, prefix=".radiotools_"
+            ) as temp_dir:
+                temp_path = Path(temp_dir) / file.name
+
+                self._ms.tofits(str(temp_path), overwrite=False)
+
+                os.replace(temp_path, file)
+
+        else:
+            warnings.warn(
+                f"The file {file} already exists! If you want to overwrite it set overwrite=True!"
+            )
+
     def get_ms(self):
         """
         Returns a copy of the current measurement as a NRAO CASA measurement set.
@@ -92,20 +132,14 @@ class Measurement:
         if not hasattr(self, "_fits_path"):
             return self._ms
 
-        def gen_rng_dir():
-            return Path(f"./temp_fits_{uuid.uuid4()}/")
+        # the temporary directory is removed even if the conversion fails
+        with tempfile.TemporaryDirectory(prefix="radiotools_") as temp_dir:
+            temp_path = Path(temp_dir) / "measurement.ms"
 
-        temp_path = gen_rng_dir()
+            self.save_as_ms(str(temp_path), overwrite=False)
 
-        while temp_path.exists():
-            temp_path = gen_rng_dir()
-
-        self.save_as_ms(temp_path.absolute(), overwrite=False)
-
-        ms = MeasurementTool()
-        ms.open(temp_path)
-
-        shutil.rmtree(temp_path)
+            ms = MeasurementTool()
+            ms.open(str(temp_path))
 
         return ms
 
@@ -120,18 +154,12 @@ class Measurement:
         if not hasattr(self, "_ms_path"):
             return self._fits
 
-        def gen_rng_file():
-            return Path(f"./temp_fits_{uuid.uuid4()}.fits")
-
-        temp_path = gen_rng_file()
-
-        while temp_path.is_file():
-            temp_path = gen_rng_file()
+        with tempfile.TemporaryDirectory(prefix="radiotools_") as temp_dir:
+            temp_path = Path(temp_dir) / "measurement.fits"
 
-        self.save_as_fits(str(temp_path), overwrite=False)
+            self.save_as_fits(str(temp_path), overwrite=False)
 
-        _fits = fits.open(temp_path)
-        temp_path.unlink()
+            _fits = fits.open(temp_path)
 
         return _fits
 
@@ -43,7 +43,8 @@ def px2radec(
     if unit not in _PREFIXES.keys():
         raise ValueError(f"Unknown unit! Please provide one of {_PREFIXES.keys()}")
 
-    px_incr = header["CDELT2"]
+    scale, unit_label = _PREFIXES[unit]
+    factor = header["CDELT2"] * scale
     ref_pos = header["CRPIX1"] - 1, header["CRPIX2"] - 1
     naxis = header["NAXIS1"], header["NAXIS2"]
 
@@ -70,14 +71,12 @@ def px2radec(
 
     xticklabels -= xshift
     yticklabels -= yshift
-    xticklabels = [
-        f"{label * px_incr * _PREFIXES[unit][0]:.2f}" if label != 0 else "0.00"
-        for label in xticklabels
-    ]
-    yticklabels = [
-        f"{label * px_incr * _PREFIXES[unit][0]:.2f}" if label != 0 else "0.00"
-        for label in yticklabels
-    ]
+
+    # zero is set explicitly to avoid '-0.00' for negative increments
+    xticklabels, yticklabels = (
+        np.where(labels == 0, "0.00", np.char.mod("%.2f", labels * factor)).tolist()
+        for labels in (xticklabels, yticklabels)
+    )
 
     if ax:
         ax.set(
@@ -87,7 +86,7 @@ def px2radec(
             yticks=yticks,
             xticklabels=xticklabels,
             yticklabels=yticklabels,
-            xlabel=rf"Relative RA $/\; \mathrm{{{_PREFIXES[unit][1]}}}$",
-            ylabel=rf"Relative Dec $/\; \mathrm{{{_PREFIXES[unit][1]}}}$",
+            xlabel=rf"Relative RA $/\; \mathrm{{{unit_label}}}$",
+            ylabel=rf"Relative Dec $/\; \mathrm{{{unit_label}}}$",
         )
     return xlim, ylim, xticks, yticks, xticklabels, yticklabels
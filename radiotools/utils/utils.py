@@ -1,9 +1,50 @@
+import re
+from functools import lru_cache
+
 import numpy as np
-import requests
 from astropy.io import fits
-from bs4 import BeautifulSoup
 from numpy.typing import ArrayLike
 
+# 4 ln(2), relates the beam FWHMs to the beam area
+_4_LN_2 = 4 * np.log(2)
+
+
+# opening <a> tags and their href/aria-label attributes
+# in a directory listing
+_A_TAG_RE = re.compile(rb"<a\s[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(rb'\b(href|aria-label)\s*=\s*"([^"]*)"', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """Returns a session shared by all requests, so that connections
+    are reused. requests is only imported here, since importing it
+    is slow and most users of this module never fetch anything.
+    """
+    import requests
+
+    return requests.Session()
+
+
+# raw directory listings by URL, see _get_listing
+_LISTINGS = {}
+
+
+def _get_listing(url: str) -> bytes:
+    """Returns the raw content of the page at ``url``.
+    Successful responses are cached for the lifetime of
+    the process, failed ones are fetched again on the next call.
+    """
+    if url not in _LISTINGS:
+        r = _get_session().get(url)
+
+        if not r.ok:
+            return r.content
+
+        _LISTINGS[url] = r.content
+
+    return _LISTINGS[url]
+
 
 def get_array_names(url: str) -> list[str]:
     """Fetches array names from a given URL
@@ -20,19 +61,16 @@ def get_array_names(url: str) -> list[str]:
     layouts : list[str]
         List of available layouts.
     """
-    r = requests.get(url)
-    soup = BeautifulSoup(r.text, features="html.parser")
-
-    a_tags = soup.find_all("a")
+    # The listing is only searched for links to txt files,
+    # so the raw response is scanned instead of parsing the HTML.
+    layouts = set()
+    for a_tag in _A_TAG_RE.findall(_get_listing(url)):
+        attrs = {key.lower(): val for key, val in _ATTR_RE.findall(a_tag)}
 
-    layouts = []
-    for i in a_tags:
-        if ".txt" in str(i.get("href")):
-            layouts.append(i.get("aria-label").split(".txt")[0])
+        if b".txt" in attrs.get(b"href", b"") and b"aria-label" in attrs:
+            layouts.add(attrs[b"aria-label"].split(b".txt")[0].decode())
 
-    layouts = list(set(layouts))
-
-    return layouts
+    return list(layouts)
 
 
 def rms(a: ArrayLike, *, axis: int | None = 0):
@@ -50,13 +88,28 @@ def rms(a: ArrayLike, *, axis: int | None = 0):
     rms : np.ndarray
         Array of rms values.
     """
-    if np.ndim(a) == 0:
+    a = np.asarray(a)
+
+    if a.ndim == 0:
         axis = None
 
-    return np.sqrt(np.mean(a**2, axis=axis))
+    if a.dtype.kind != "f":
+        return np.sqrt(np.mean(a**2, axis=axis))
 
+    # For floats, the sum of squares is computed as a dot product
+    # along the reduced axis, without a temporary array of squares.
+    # It is accumulated in at least float64, since float16 squares
+    # overflow and float32 sums lose precision for large arrays.
+    a = a.reshape(-1) if axis is None else np.moveaxis(a, axis, -1)
 
-def img2jansky(image: ArrayLike, header: fits.Header):
+    sq_sum = np.einsum(
+        "...i,...i->...", a, a, dtype=np.promote_types(a.dtype, np.float64)
+    )
+
+    return np.sqrt(sq_sum / a.shape[-1]).astype(a.dtype, copy=False)
+
+
+def img2jansky(image: ArrayLike, header: fits.Header, *, out: np.ndarray | None = None):
     """Converts an image from Jy/beam to Jy/px.
 
     Parameters
@@ -65,16 +118,20 @@ def img2jansky(image: ArrayLike, header: fits.Header):
         Input image that is to be converted.
     header : :class:`astropy.io.fits.header.Header`
         FITS file header belonging to the respective image.
+    out : np.ndarray or None, optional
+        Array the result is written to. Passing the image
+        itself converts it in place. For images larger than
+        the memory, pass a :class:`numpy.memmap` to write the
+        result to disk directly. Default: ``None``
 
     Returns
     -------
     array_like
         Converted image in units of Jy/px.
     """
-    return (
-        4
-        * image
-        * np.log(2)
-        * np.power(header["CDELT1"], 2)
-        / (np.pi * header["BMIN"] * header["BMAJ"])
-    )
+    cdelt, bmin, bmaj = header["CDELT1"], header["BMIN"], header["BMAJ"]
+
+    # scalar conversion factor, so that the image is only multiplied once
+    factor = _4_LN_2 * cdelt * cdelt / (np.pi * bmin * bmaj)
+
+    return np.multiply(image, factor, out=out)
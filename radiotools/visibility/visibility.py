@@ -1,7 +1,9 @@
 """Shows the source visibility at a given location and time."""
 
+import copy
 import datetime
-from collections import namedtuple
+import itertools
+from functools import lru_cache
 
 import astropy.units as u
 import dateutil.parser
@@ -11,6 +13,7 @@ import numpy as np
 import pandas as pd
 from astropy.coordinates import AltAz, BaseCoordinateFrame, EarthLocation, SkyCoord
 from astropy.time import Time
+from astropy.utils.data import download_file
 from rich.console import Console
 from rich.table import Table
 
@@ -34,6 +37,34 @@ PYVISGEN = "https://raw.githubusercontent.com/radionets-project/pyvisgen/"
 PYVISGEN += "refs/heads/main/pyvisgen/layouts/"
 
 
+# The following lookups are requests to online services and
+# are cached, since sweeps often create many instances for
+# the same target and location.
+@lru_cache(maxsize=256)
+def _resolve_name(name: str) -> SkyCoord:
+    """Returns the ICRS coordinates of a named target."""
+    return SkyCoord.from_name(name)
+
+
+@lru_cache(maxsize=256)
+def _resolve_address(address: str) -> EarthLocation:
+    """Returns the location of an address."""
+    return EarthLocation.of_address(address)
+
+
+@lru_cache(maxsize=32)
+def _load_layout(url: str) -> Layout:
+    """Returns the array layout at ``url``. Copy before modifying it.
+    The file is kept in the astropy download cache, so it is only
+    downloaded once across sessions. Use
+    :func:`astropy.utils.data.clear_download_cache` to fetch it again.
+    """
+    layout = Layout.from_url(download_file(url, cache=True))
+    layout.cfg_path = url
+
+    return layout
+
+
 class SourceVisibility:
     """Plots the source visibility for a given location
     and time range.
@@ -66,6 +97,7 @@ class SourceVisibility:
         min_alt: float = 15.0,
         max_alt: float = 85.0,
         print_optimal_date: bool = False,
+        n_samples: int = 1000,
     ) -> None:
         """Initializes the class with source and observation information.
 
@@ -93,6 +125,11 @@ class SourceVisibility:
             be determined as visible. Default: 85.0
         print_optimal_date: bool, optional
             If `True` prints the optimal date for the observation. Default: ``False``
+        n_samples : int, optional
+            Number of dates the date range is sampled at. Fewer samples
+            are faster to compute, at the cost of a coarser resolution
+            of the optimal date, e.g. for short observations within a
+            long range of dates. Default: 1000
         """
         if isinstance(target, tuple) or (
             isinstance(target, np.ndarray) and target.size == 2
@@ -103,7 +140,12 @@ class SourceVisibility:
             self.target_name = None
 
         elif isinstance(target, str):
-            self.source = SkyCoord.from_name(target, frame=frame)
+            self.source = _resolve_name(target)
+
+            # same as SkyCoord.from_name, which resolves to ICRS
+            if frame != "icrs":
+                self.source = self.source.transform_to(frame)
+
             self.ra = self.source.ra
             self.dec = self.source.dec
             self.target_name = target
@@ -115,7 +157,7 @@ class SourceVisibility:
 
         if isinstance(location, str) and location in get_array_names(PYVISGEN):
             self.name = location
-            self.array = Layout.from_url(PYVISGEN + location)
+            self.array = copy.deepcopy(_load_layout(PYVISGEN + location))
 
             self.location = EarthLocation.from_geocentric(
                 self.array.x * u.m, self.array.y * u.m, self.array.z * u.m
@@ -123,7 +165,7 @@ class SourceVisibility:
 
         elif isinstance(location, str):
             self.name = location
-            self.location = EarthLocation.of_address(location)
+            self.location = _resolve_address(location)
 
         elif isinstance(location, EarthLocation):
             self.name = location
@@ -134,6 +176,7 @@ class SourceVisibility:
 
         self.date = date
         self.obs_length = obs_length
+        self.n_samples = n_samples
 
         if min_alt > max_alt:
             raise ValueError(
@@ -164,10 +207,14 @@ class SourceVisibility:
             start_date = dateutil.parser.parse(self.date[0])
             end_date = dateutil.parser.parse(self.date[1])
 
-        self.dates = pd.date_range(start_date, end_date, periods=1000).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
-        self.dates = pd.to_datetime(self.dates)
+        dates = pd.date_range(start_date, end_date, periods=self.n_samples)
+
+        # timezone-aware dates are converted to naive UTC dates
+        if dates.tz is not None:
+            dates = dates.tz_convert("UTC").tz_localize(None)
+
+        # dates are given in whole seconds
+        self.dates = dates.floor("s")
 
     def _get_pos(self) -> None:
         """Creates the sky coordinates of the source
@@ -175,20 +222,18 @@ class SourceVisibility:
         (default is ICRS) and calculates the altitude
         and azimuth in the AltAz frame.
         """
-        self.source_pos = dict()
+        obstime = Time(self.dates.to_numpy(), format="datetime64")
 
-        if self.location.size == 1:
-            altaz_frame = AltAz(obstime=Time(self.dates), location=self.location)
-            self.source_pos[0] = self.source.transform_to(altaz_frame)
+        # The stations are broadcast against the dates, so that the
+        # source is transformed for all of them at once,
+        # shape (n_stations, n_dates)
+        location = self.location.reshape(-1, 1)
+        source_pos = self.source.transform_to(AltAz(obstime=obstime, location=location))
 
-        elif self.location.size > 10:
-            altaz_frame = AltAz(obstime=Time(self.dates), location=self.location[0])
-            self.source_pos[0] = self.source.transform_to(altaz_frame)
+        self.source_pos = {i: pos for i, pos in enumerate(source_pos)}
 
-        else:
-            for i, loc in enumerate(self.location):
-                altaz_frame = AltAz(obstime=Time(self.dates), location=loc)
-                self.source_pos[i] = self.source.transform_to(altaz_frame)
+        # altitudes in deg, shape (n_stations, n_dates)
+        self._alt_deg = source_pos.alt.to_value(u.deg)
 
     def _plot_config(self, ax) -> None:
         """Settings for the plot.
@@ -232,9 +277,7 @@ class SourceVisibility:
         text = "Solid lines indicate that the source\n"
         text += "is visible. The visibility window is\n"
         text += f"limited to a range between {self.min_alt} deg\n"
-        text += f"and {self.max_alt} deg. For array layouts with\n"
-        text += "more than 10 stations, only the first\n"
-        text += "station (ID 0) is shown."
+        text += f"and {self.max_alt} deg."
 
         ax["B"].annotate(
             text,
@@ -287,9 +330,7 @@ class SourceVisibility:
             Figure and axis objects.
         """
         if colors is None:
-            colors = iter(COLORS)
-        else:
-            colors = iter(colors)
+            colors = COLORS
 
         fig, ax = plt.subplot_mosaic(
             "AB",
@@ -298,44 +339,28 @@ class SourceVisibility:
             width_ratios=[3, 2],
         )
 
-        for i, source_pos in enumerate(self.source_pos.values()):
-            color = next(colors)
+        # shape (n_dates, n_stations), i.e. one column per line
+        alt = self._alt_deg.T
+        visible = np.where((alt > self.min_alt) & (alt < self.max_alt), alt, np.nan)
 
-            mask = np.logical_and(
-                source_pos.alt > self.min_alt * u.deg,
-                self.max_alt * u.deg > source_pos.alt,
-            )
-            visible = source_pos.alt.copy()
-            visible.value[~mask] = np.nan
-
-            ax["A"].plot(
-                self.dates,
-                source_pos.alt,
-                linestyle=":",
-                color=color,
-            )
-            ax["A"].plot(
-                self.dates,
-                visible,
-                lw=4,
-                color=color,
-                label=f"{i}",
-            )
+        # plain datetime64 values are plotted without the pandas converters
+        dates = self.dates.to_numpy()
+
+        dotted_lines = ax["A"].plot(dates, alt, linestyle=":")
+        solid_lines = ax["A"].plot(dates, visible, lw=4)
 
-        ax["A"].plot()
+        # colors are repeated for layouts with more stations than colors
+        for i, (dotted, solid, color) in enumerate(
+            zip(dotted_lines, solid_lines, itertools.cycle(colors))
+        ):
+            dotted.set_color(color)
+            solid.set_color(color)
+            solid.set_label(f"{i}")
 
         self._plot_config(ax)
 
         return fig, ax
 
-    def _time_delta(self, r1, r2):
-        latest_start = max(r1.start, r2.start)
-        earliest_end = min(r1.end, r2.end)
-
-        delta = earliest_end - latest_start
-
-        return max(0, delta)
-
     def get_optimal_date(self, print_result: bool = False) -> list:
         """Computes the best date to observe the target source.
         Returns a list of three :class:`~pandas.Timestamp` where the
@@ -351,42 +376,39 @@ class SourceVisibility:
         result : list
             List of :class:`~pandas.Timestamp`.
         """
-        times = dict()
-        t_range = namedtuple("t_range", ["start", "end"])
-
-        for key, val in self.source_pos.items():
-            maximum = np.max(val.alt)
-            if maximum > self.max_alt * u.deg or maximum < self.min_alt * u.deg:
-                continue
-            idx_max = np.argmax(val.alt)
-            delta = datetime.timedelta(hours=self.obs_length / 2)
-            times[key] = [
-                self.dates[idx_max] - delta,
-                self.dates[idx_max],
-                self.dates[idx_max] + delta,
-            ]
-
-        dt = np.zeros([len(times), len(times)])
-        for i, key_i in enumerate(times):
-            for j, key_j in enumerate(times):
-                r1 = t_range(
-                    start=times[key_i][0].to_datetime64(),
-                    end=times[key_i][-1].to_datetime64(),
-                )
-                r2 = t_range(
-                    start=times[key_j][0].to_datetime64(),
-                    end=times[key_j][-1].to_datetime64(),
-                )
-
-                dt[i, j] = self._time_delta(r1, r2)
-
-        if dt.sum(axis=0).size == 0:
+        # maximum altitude of each station and the index of its date
+        idx_max = self._alt_deg.argmax(axis=1)
+        maxima = self._alt_deg[np.arange(idx_max.size), idx_max]
+
+        stations = np.flatnonzero((maxima <= self.max_alt) & (maxima >= self.min_alt))
+
+        if stations.size == 0:
             raise ValueError(
                 "The source is not visible with the chosen parameters, "
                 "so no optimal date could be determined!"
             )
 
-        result = times[np.argmax(dt.sum(axis=0))]
+        delta = datetime.timedelta(hours=self.obs_length / 2)
+
+        # The observation windows only depend on the date of the maximum
+        # altitude, so stations sharing that date are compared only once.
+        idx_unique, inverse, counts = np.unique(
+            idx_max[stations], return_inverse=True, return_counts=True
+        )
+        midpoints = self.dates[idx_unique]
+        starts = (midpoints - delta).to_numpy()
+        ends = (midpoints + delta).to_numpy()
+
+        # pairwise overlap of the observation windows
+        dt = np.minimum.outer(ends, ends) - np.maximum.outer(starts, starts)
+        dt = np.maximum(dt, np.timedelta64(0))
+
+        # total overlap of every station with all others
+        overlap = (dt * counts).sum(axis=1)[inverse]
+        station = stations[np.argmax(overlap)]
+
+        midpoint = self.dates[idx_max[station]]
+        result = [midpoint - delta, midpoint, midpoint + delta]
 
         if print_result:
             print("")
@@ -397,7 +419,7 @@ class SourceVisibility:
             tab.add_column("Obs. time end")
 
             tab.add_row(
-                f"{np.argmax(dt.sum(axis=0))}",
+                f"{station}",
                 result[0].strftime("%Y-%m-%d %H:%M:%S"),
                 result[1].strftime("%Y-%m-%d %H:%M:%S"),
                 result[2].strftime("%Y-%m-%d %H:%M:%S"),
@@ -0,0 +1,31 @@
+import matplotlib
+import pytest
+
+
+def pytest_configure(config):
+    # Figures are only created, never shown, so the non-interactive
+    # Agg backend avoids loading a GUI toolkit.
+    matplotlib.use("Agg", force=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def iers_table():
+    """Loads the IERS table once, so that it is shared by all
+    coordinate transforms of the session instead of being
+    loaded by whichever test transforms first.
+    """
+    from astropy.utils import iers
+
+    return iers.IERS_Auto.open()
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Closes all figures after each test, so that they do not
+    accumulate in pyplot's figure registry.
+    """
+    yield
+
+    import matplotlib.pyplot as plt
+
+    plt.close("all")
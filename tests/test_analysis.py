@@ -52,3 +52,23 @@ class TestRMS:
         expected = 10.0
 
         assert rms(a) == expected
+
+    def test_float16(self):
+        """Test float16 input, whose squares overflow float16."""
+        a = np.full(100000, 10.0, dtype=np.float16)
+        expected = np.sqrt(np.mean(a**2))
+
+        assert rms(a).dtype == np.float16
+        assert_allclose(rms(a), expected)
+
+    def test_float32(self):
+        """Test float32 input along an axis against np.mean."""
+        rng = np.random.default_rng(42)
+        a = rng.normal(size=(4, 250000)).astype(np.float32)
+        expected = np.sqrt(np.mean(a**2, axis=1))
+
+        assert rms(a, axis=1).dtype == np.float32
+        assert_allclose(rms(a, axis=1), expected, rtol=1e-6)
+        assert_allclose(
+            rms(np.full(10**7, 0.1, dtype=np.float32)), np.float32(0.1), rtol=1e-7
+        )
@@ -0,0 +1,89 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+
+def test_decimate_keeps_sparse_pixels():
+    from radiotools.gridding.gridding import _decimate
+
+    rng = np.random.default_rng(42)
+
+    img = np.zeros((4096, 4096), dtype=np.float32)
+    rows, cols = rng.integers(0, 4096, size=(2, 4000))
+    img[rows, cols] = rng.uniform(1, 5, size=4000)
+
+    fig = plt.figure(figsize=(1, 1), dpi=64)
+    decimated, plot_args = _decimate(img, fig, ([None, None], [None, None]), {})
+
+    stride = 4096 // decimated.shape[0]
+    assert stride > 1
+
+    # every block containing a non-empty pixel stays non-empty
+    assert np.count_nonzero(decimated) == len(set(zip(rows // stride, cols // stride)))
+    assert decimated.max() == img.max()
+    assert plot_args["extent"] == (-0.5, 4095.5, -0.5, 4095.5)
+
+
+def _gridder(img_size, n_samples=5000):
+    from radiotools.gridding import Gridder
+
+    rng = np.random.default_rng(42)
+
+    gridder = Gridder()
+    gridder.img_size = img_size
+    gridder.fov = 0.05 * np.pi / (3600 * 180)
+    gridder.freq = 230e9
+
+    # some samples fall outside of the grid
+    uu = rng.normal(0, 1e5, size=(1, n_samples))
+    vv = rng.normal(0, 1e5, size=(1, n_samples))
+    stokes_i = rng.normal(size=(n_samples, 1)) + 1j * rng.normal(size=(n_samples, 1))
+
+    return gridder._create_attributes(uu, vv, stokes_i)
+
+
+@pytest.mark.parametrize("img_size", [32, 33])
+def test_gridding(img_size):
+    gridder = _gridder(img_size)
+
+    # reference: grid the samples and their Hermitian counterparts
+    u = np.asarray(gridder.u).ravel()
+    v = np.asarray(gridder.v).ravel()
+    samps = np.array(
+        [
+            np.append(-u, u),
+            np.append(-v, v),
+            np.append(gridder.stokes_i.real, gridder.stokes_i.real),
+            np.append(gridder.stokes_i.imag, -gridder.stokes_i.imag),
+        ]
+    )
+
+    N = img_size
+    delta = 1 / gridder.fov
+    bins = np.arange(-(N / 2) * delta, (N / 2 + 1) * delta, delta) - delta / 2
+
+    mask, *_ = np.histogram2d(samps[0], samps[1], bins=[bins, bins])
+    mask[mask == 0] = 1
+    mask_real, *_ = np.histogram2d(
+        samps[0], samps[1], bins=[bins, bins], weights=samps[2]
+    )
+    mask_imag, *_ = np.histogram2d(
+        samps[0], samps[1], bins=[bins, bins], weights=samps[3]
+    )
+
+    assert_allclose(gridder.mask, mask)
+    assert_allclose(gridder.mask_real, mask_real / mask, atol=1e-12)
+    assert_allclose(gridder.mask_imag, mask_imag / mask, atol=1e-12)
+
+
+@pytest.mark.parametrize("img_size", [32, 33])
+def test_dirty_image(img_size):
+    gridder = _gridder(img_size)
+
+    dirty_img_cmplx = np.fft.fftshift(
+        np.fft.ifft2(np.fft.fftshift(gridder.mask_real + 1j * gridder.mask_imag))
+    )
+
+    assert_allclose(gridder.dirty_img_cmplx, dirty_img_cmplx, atol=1e-12)
+    assert_allclose(gridder.dirty_img, dirty_img_cmplx.real[:, ::-1], atol=1e-12)